@@ -9,16 +9,23 @@ Run: python examples/real_chip_benchmarks.py
 
 from __future__ import annotations
 
+import io
+import sys
 from dataclasses import dataclass
 
-from thermal_mcp_server.physics import COOLANTS, analyze, optimize_flow
-from thermal_mcp_server.schemas import AnalyzeColdplateInput, OptimizeFlowRateInput
+from thermal_mcp_server.physics import analyze_batch, analyze_coolants, optimize_flow
+from thermal_mcp_server.schemas import AnalyzeBatchInput, CompareCoolantsInput, OptimizeFlowRateInput
 
 
 # ---------------------------------------------------------------------------
 # Chip specs — verified against vendor datasheets
 # ---------------------------------------------------------------------------
 
+# R_jc + R_tim + R_base for the default stack and geometry (0.04 + 0.02 + 0.000519 =
+# 0.0605 K/W), rounded up to 0.061 K/W as used in the printed report.
+R_FIXED_K_PER_W = 0.061
+
+
 @dataclass(frozen=True)
 class ChipSpec:
     name: str
@@ -26,6 +33,15 @@ class ChipSpec:
     tj_limit_c: float
     tj_source: str
 
+    @property
+    def fixed_rise_c(self) -> float:
+        """Junction rise across the fixed resistances alone, independent of flow rate."""
+        return self.tdp_w * R_FIXED_K_PER_W
+
+    def tj_floor_at_inlet(self, inlet_c: float) -> float:
+        """Lowest junction temperature reachable at any flow rate for this inlet temperature."""
+        return inlet_c + self.fixed_rise_c
+
 
 # Sources:
 # H100 SXM:  NVIDIA H100 Datasheet (resources.nvidia.com)
@@ -42,6 +58,11 @@ GAUDI3_LIQUID = ChipSpec("Gaudi 3 OAM (liquid)", 1200, 85.0, "Intel does not pub
 ALL_CHIPS = [H100_SXM, B200_NVL72, MI300X, GAUDI3_AIR, GAUDI3_LIQUID]
 
 
+def _emit(buf: io.StringIO, *lines: str) -> None:
+    """Append lines to a benchmark's report; each benchmark writes its report to stdout once."""
+    buf.write("\n".join(lines) + "\n")
+
+
 # ---------------------------------------------------------------------------
 # Benchmark 1: H100 SXM — Minimum flow rate sizing
 # ---------------------------------------------------------------------------
@@ -51,45 +72,51 @@ def benchmark_h100_flow_sweep() -> dict[str, object]:
 
     Decision: What's the minimum flow rate to keep Tj < 83°C? This sizes the pump.
     """
+    buf = io.StringIO()
     chip = H100_SXM
     inlet_c = 35.0
     flow_rates = list(range(2, 16))  # 2 to 15 LPM in 1 LPM increments
 
-    print("=" * 72)
-    print(f"Benchmark 1: {chip.name} — Minimum Flow Rate Sizing")
-    print(f"  TDP: {chip.tdp_w} W | Coolant: water | Inlet: {inlet_c}°C")
-    print(f"  Target: Tj < {chip.tj_limit_c}°C ({chip.tj_source})")
-    print("-" * 72)
-    print(f"  {'Flow (LPM)':>12}  {'Tj (°C)':>10}  {'ΔP (kPa)':>10}  {'Status':>10}")
-    print("-" * 72)
+    _emit(
+        buf,
+        "=" * 72,
+        f"Benchmark 1: {chip.name} — Minimum Flow Rate Sizing",
+        f"  TDP: {chip.tdp_w} W | Coolant: water | Inlet: {inlet_c}°C",
+        f"  Target: Tj < {chip.tj_limit_c}°C ({chip.tj_source})",
+        "-" * 72,
+        f"  {'Flow (LPM)':>12}  {'Tj (°C)':>10}  {'ΔP (kPa)':>10}  {'Status':>10}",
+        "-" * 72,
+    )
 
     min_flow: float | None = None
     results: list[dict[str, float]] = []
 
-    for lpm in flow_rates:
-        result = analyze(AnalyzeColdplateInput(
-            heat_load_w=chip.tdp_w,
-            flow_rate_lpm=float(lpm),
-            inlet_temp_c=inlet_c,
-            coolant="water",
-        ))
+    sweep = analyze_batch(AnalyzeBatchInput(
+        heat_load_w=chip.tdp_w,
+        inlet_temp_c=inlet_c,
+        coolant="water",
+        flow_rates_lpm=[float(lpm) for lpm in flow_rates],
+    ))
+
+    for lpm, result in zip(flow_rates, sweep):
         status = "OK" if result.junction_temp_c < chip.tj_limit_c else "OVER"
         if status == "OK" and min_flow is None:
             min_flow = float(lpm)
-        print(f"  {lpm:>12}  {result.junction_temp_c:>10.1f}  {result.pressure_drop_pa / 1000:>10.1f}  {status:>10}")
+        _emit(buf, f"  {lpm:>12}  {result.junction_temp_c:>10.1f}  {result.pressure_drop_pa / 1000:>10.1f}  {status:>10}")
         results.append({
             "flow_lpm": float(lpm),
             "tj_c": result.junction_temp_c,
             "dp_kpa": result.pressure_drop_pa / 1000,
         })
 
-    print("-" * 72)
+    _emit(buf, "-" * 72)
     if min_flow is not None:
-        print(f"  Minimum flow rate for Tj < {chip.tj_limit_c}°C: {min_flow} LPM")
+        _emit(buf, f"  Minimum flow rate for Tj < {chip.tj_limit_c}°C: {min_flow} LPM")
     else:
-        print(f"  WARNING: No tested flow rate keeps Tj < {chip.tj_limit_c}°C at {inlet_c}°C inlet")
-    print()
+        _emit(buf, f"  WARNING: No tested flow rate keeps Tj < {chip.tj_limit_c}°C at {inlet_c}°C inlet")
+    _emit(buf, "")
 
+    sys.stdout.write(buf.getvalue())
     return {"chip": chip.name, "min_flow_lpm": min_flow, "results": results}
 
 
@@ -108,27 +135,32 @@ def benchmark_b200_coolant_comparison() -> dict[str, object]:
     values. For propylene glycol, thermal conductivity is ~10% lower and viscosity
     is ~20% higher — the penalty shown here is a lower bound.
     """
+    buf = io.StringIO()
     chip = B200_NVL72
     flow_lpm = 10.0
     inlet_c = 35.0
 
-    print("=" * 72)
-    print(f"Benchmark 2: {chip.name} — Coolant Comparison")
-    print(f"  TDP: {chip.tdp_w} W | Flow: {flow_lpm} LPM | Inlet: {inlet_c}°C")
-    print("-" * 72)
-    print(f"  {'Coolant':>16}  {'Tj (°C)':>10}  {'ΔP (kPa)':>10}  {'Pump (W)':>10}  {'Regime':>12}")
-    print("-" * 72)
+    _emit(
+        buf,
+        "=" * 72,
+        f"Benchmark 2: {chip.name} — Coolant Comparison",
+        f"  TDP: {chip.tdp_w} W | Flow: {flow_lpm} LPM | Inlet: {inlet_c}°C",
+        "-" * 72,
+        f"  {'Coolant':>16}  {'Tj (°C)':>10}  {'ΔP (kPa)':>10}  {'Pump (W)':>10}  {'Regime':>12}",
+        "-" * 72,
+    )
 
     comparison: dict[str, dict[str, float]] = {}
 
-    for coolant_name in COOLANTS:
-        result = analyze(AnalyzeColdplateInput(
-            heat_load_w=chip.tdp_w,
-            flow_rate_lpm=flow_lpm,
-            inlet_temp_c=inlet_c,
-            coolant=coolant_name,
-        ))
-        print(
+    results = analyze_coolants(CompareCoolantsInput(
+        heat_load_w=chip.tdp_w,
+        flow_rate_lpm=flow_lpm,
+        inlet_temp_c=inlet_c,
+    ))
+
+    for coolant_name, result in results.items():
+        _emit(
+            buf,
             f"  {coolant_name:>16}  "
             f"{result.junction_temp_c:>10.1f}  "
             f"{result.pressure_drop_pa / 1000:>10.1f}  "
@@ -146,11 +178,15 @@ def benchmark_b200_coolant_comparison() -> dict[str, object]:
     dp_water = comparison["water"]["dp_kpa"]
     dp_glycol = comparison["glycol50"]["dp_kpa"]
 
-    print("-" * 72)
-    print(f"  Glycol penalty: +{tj_glycol - tj_water:.1f}°C junction temp, "
-          f"+{dp_glycol - dp_water:.1f} kPa pressure drop")
-    print()
+    _emit(
+        buf,
+        "-" * 72,
+        f"  Glycol penalty: +{tj_glycol - tj_water:.1f}°C junction temp, "
+        f"+{dp_glycol - dp_water:.1f} kPa pressure drop",
+        "",
+    )
 
+    sys.stdout.write(buf.getvalue())
     return {"chip": chip.name, "comparison": comparison}
 
 
@@ -168,34 +204,41 @@ def benchmark_mi300x_inlet_sweep() -> dict[str, object]:
     conservative proxy based on typical datacenter GPU thermal management
     practice.
     """
+    buf = io.StringIO()
     chip = MI300X
     flow_lpm = 8.0
     inlet_temps = list(range(20, 50, 5))  # 20°C to 45°C in 5°C steps
 
-    print("=" * 72)
-    print(f"Benchmark 3: {chip.name} — Inlet Temperature Sensitivity")
-    print(f"  TDP: {chip.tdp_w} W | Coolant: water | Flow: {flow_lpm} LPM")
-    print(f"  Tj limit: {chip.tj_limit_c}°C ({chip.tj_source})")
-    print("-" * 72)
-    print(f"  {'Inlet (°C)':>12}  {'Tj (°C)':>10}  {'Margin (°C)':>12}  {'Status':>10}")
-    print("-" * 72)
+    _emit(
+        buf,
+        "=" * 72,
+        f"Benchmark 3: {chip.name} — Inlet Temperature Sensitivity",
+        f"  TDP: {chip.tdp_w} W | Coolant: water | Flow: {flow_lpm} LPM",
+        f"  Tj limit: {chip.tj_limit_c}°C ({chip.tj_source})",
+        "-" * 72,
+        f"  {'Inlet (°C)':>12}  {'Tj (°C)':>10}  {'Margin (°C)':>12}  {'Status':>10}",
+        "-" * 72,
+    )
 
     results: list[dict[str, float]] = []
 
-    for inlet_c in inlet_temps:
-        result = analyze(AnalyzeColdplateInput(
-            heat_load_w=chip.tdp_w,
-            flow_rate_lpm=flow_lpm,
-            inlet_temp_c=float(inlet_c),
-            coolant="water",
-        ))
+    sweep = analyze_batch(AnalyzeBatchInput(
+        heat_load_w=chip.tdp_w,
+        flow_rate_lpm=flow_lpm,
+        coolant="water",
+        inlet_temps_c=[float(inlet_c) for inlet_c in inlet_temps],
+    ))
+
+    for inlet_c, result in zip(inlet_temps, sweep):
         margin = chip.tj_limit_c - result.junction_temp_c
-        status = "OK" if margin > 0 else "EXCEEDS"
         if margin <= 0:
             status = "EXCEEDS"
         elif margin < 3:
             status = "TIGHT"
-        print(
+        else:
+            status = "OK"
+        _emit(
+            buf,
             f"  {inlet_c:>12}  "
             f"{result.junction_temp_c:>10.1f}  "
             f"{margin:>12.1f}  "
@@ -207,18 +250,22 @@ def benchmark_mi300x_inlet_sweep() -> dict[str, object]:
             "margin_c": margin,
         })
 
-    print("-" * 72)
+    _emit(buf, "-" * 72)
     # Find max inlet temp that stays under limit
     safe_inlets = [r for r in results if r["margin_c"] > 0]
     if safe_inlets:
         max_safe = safe_inlets[-1]
-        print(f"  Max safe inlet temp: {max_safe['inlet_c']:.0f}°C "
-              f"(Tj = {max_safe['tj_c']:.1f}°C, margin = {max_safe['margin_c']:.1f}°C)")
+        _emit(
+            buf,
+            f"  Max safe inlet temp: {max_safe['inlet_c']:.0f}°C "
+            f"(Tj = {max_safe['tj_c']:.1f}°C, margin = {max_safe['margin_c']:.1f}°C)",
+        )
     over_inlets = [r for r in results if r["margin_c"] <= 0]
     if over_inlets:
-        print(f"  Tj exceeds {chip.tj_limit_c}°C at inlet >= {over_inlets[0]['inlet_c']:.0f}°C")
-    print()
+        _emit(buf, f"  Tj exceeds {chip.tj_limit_c}°C at inlet >= {over_inlets[0]['inlet_c']:.0f}°C")
+    _emit(buf, "")
 
+    sys.stdout.write(buf.getvalue())
     return {"chip": chip.name, "results": results}
 
 
@@ -238,18 +285,22 @@ def benchmark_gaudi3_flow_optimization() -> dict[str, object]:
     larger contact area, more channels, and optimized TIM to achieve lower
     total resistance.
     """
+    buf = io.StringIO()
     tj_limit = 85.0  # Conservative proxy — Intel does not publish Tj_max for Gaudi 3
     flow_max = 100.0
 
-    print("=" * 72)
-    print("Benchmark 4: Gaudi 3 OAM — Flow Rate Optimization")
-    print(f"  Coolant: water | Target: Tj < {tj_limit}°C")
-    print()
+    _emit(
+        buf,
+        "=" * 72,
+        "Benchmark 4: Gaudi 3 OAM — Flow Rate Optimization",
+        f"  Coolant: water | Target: Tj < {tj_limit}°C",
+        "",
+    )
 
     # --- Part A: 30°C inlet (typical warm-climate CDU setpoint) ---
     inlet_30 = 30.0
-    print(f"  Part A: Inlet = {inlet_30}°C")
-    print("-" * 72)
+    _emit(buf, f"  Part A: Inlet = {inlet_30}°C")
+    _emit(buf, "-" * 72)
 
     for chip in [GAUDI3_AIR, GAUDI3_LIQUID]:
         opt_input = OptimizeFlowRateInput(
@@ -262,16 +313,22 @@ def benchmark_gaudi3_flow_optimization() -> dict[str, object]:
         )
         _, result = optimize_flow(opt_input)
         # At 30°C inlet, R_fixed × TDP ≈ 55–73°C rise → cannot meet 85°C
-        print(f"  {chip.name} ({chip.tdp_w:.0f}W):")
-        print(f"    Cannot meet {tj_limit}°C — min ΔTj from R_fixed alone = "
-              f"{chip.tdp_w * 0.061:.0f}°C (+ {inlet_30}°C inlet = "
-              f"{inlet_30 + chip.tdp_w * 0.061:.0f}°C min)")
+        _emit(buf, f"  {chip.name} ({chip.tdp_w:.0f}W):")
+        _emit(
+            buf,
+            f"    Cannot meet {tj_limit}°C — min ΔTj from R_fixed alone = "
+            f"{chip.fixed_rise_c:.0f}°C (+ {inlet_30}°C inlet = "
+            f"{chip.tj_floor_at_inlet(inlet_30):.0f}°C min)",
+        )
 
     # --- Part B: 25°C inlet (typical cold-climate / well-provisioned CDU) ---
     inlet_25 = 25.0
-    print()
-    print(f"  Part B: Inlet = {inlet_25}°C (lower CDU setpoint)")
-    print("-" * 72)
+    _emit(
+        buf,
+        "",
+        f"  Part B: Inlet = {inlet_25}°C (lower CDU setpoint)",
+        "-" * 72,
+    )
 
     configs: dict[str, dict[str, float]] = {}
 
@@ -287,12 +344,15 @@ def benchmark_gaudi3_flow_optimization() -> dict[str, object]:
         min_flow, result = optimize_flow(opt_input)
 
         if result is not None:
-            print(f"  {chip.name}:")
-            print(f"    TDP:            {chip.tdp_w:>8.0f} W")
-            print(f"    Min flow rate:  {min_flow:>8.1f} LPM")
-            print(f"    Tj at min flow: {result.junction_temp_c:>8.1f} °C")
-            print(f"    Pressure drop:  {result.pressure_drop_pa / 1000:>8.1f} kPa")
-            print(f"    Pump power:     {result.pump_power_w:>8.2f} W")
+            _emit(
+                buf,
+                f"  {chip.name}:",
+                f"    TDP:            {chip.tdp_w:>8.0f} W",
+                f"    Min flow rate:  {min_flow:>8.1f} LPM",
+                f"    Tj at min flow: {result.junction_temp_c:>8.1f} °C",
+                f"    Pressure drop:  {result.pressure_drop_pa / 1000:>8.1f} kPa",
+                f"    Pump power:     {result.pump_power_w:>8.2f} W",
+            )
             configs[chip.name] = {
                 "tdp_w": chip.tdp_w,
                 "min_flow_lpm": min_flow,
@@ -301,9 +361,12 @@ def benchmark_gaudi3_flow_optimization() -> dict[str, object]:
                 "pump_w": result.pump_power_w,
             }
         else:
-            print(f"  {chip.name} ({chip.tdp_w:.0f}W):")
-            print(f"    Cannot meet {tj_limit}°C even at {inlet_25}°C inlet")
-            print(f"    Cold plate redesign required for this power class")
+            _emit(
+                buf,
+                f"  {chip.name} ({chip.tdp_w:.0f}W):",
+                f"    Cannot meet {tj_limit}°C even at {inlet_25}°C inlet",
+                "    Cold plate redesign required for this power class",
+            )
             configs[chip.name] = {"tdp_w": chip.tdp_w, "min_flow_lpm": None}
 
     air = configs.get("Gaudi 3 OAM (air)", {})
@@ -311,22 +374,32 @@ def benchmark_gaudi3_flow_optimization() -> dict[str, object]:
     air_flow = air.get("min_flow_lpm")
     liq_flow = liq.get("min_flow_lpm")
 
-    print()
+    _emit(buf, "")
     if air_flow is not None and liq_flow is not None:
-        print(f"  At {inlet_25}°C inlet, liquid-cooled OAM requires "
-              f"+{liq_flow - air_flow:.1f} LPM "
-              f"({liq_flow:.1f} vs {air_flow:.1f} LPM) "
-              f"for +{liq['tdp_w'] - air['tdp_w']:.0f} W additional TDP")
+        _emit(
+            buf,
+            f"  At {inlet_25}°C inlet, liquid-cooled OAM requires "
+            f"+{liq_flow - air_flow:.1f} LPM "
+            f"({liq_flow:.1f} vs {air_flow:.1f} LPM) "
+            f"for +{liq['tdp_w'] - air['tdp_w']:.0f} W additional TDP",
+        )
     elif air_flow is not None and liq_flow is None:
-        print(f"  At {inlet_25}°C inlet, air-cooled OAM ({GAUDI3_AIR.tdp_w:.0f}W) "
-              f"needs {air_flow:.1f} LPM with default geometry.")
-        print(f"  Liquid-cooled OAM ({GAUDI3_LIQUID.tdp_w:.0f}W) still exceeds "
-              f"what this cold plate geometry can handle — redesign needed.")
+        _emit(
+            buf,
+            f"  At {inlet_25}°C inlet, air-cooled OAM ({GAUDI3_AIR.tdp_w:.0f}W) "
+            f"needs {air_flow:.1f} LPM with default geometry.",
+        )
+        _emit(
+            buf,
+            f"  Liquid-cooled OAM ({GAUDI3_LIQUID.tdp_w:.0f}W) still exceeds "
+            f"what this cold plate geometry can handle — redesign needed.",
+        )
     elif air_flow is None and liq_flow is None:
-        print(f"  Neither variant achievable at {inlet_25}°C with default geometry.")
-        print("  Cold plate redesign required for 900W+ class GPUs.")
-    print()
+        _emit(buf, f"  Neither variant achievable at {inlet_25}°C with default geometry.")
+        _emit(buf, "  Cold plate redesign required for 900W+ class GPUs.")
+    _emit(buf, "")
 
+    sys.stdout.write(buf.getvalue())
     return {"configs": configs}
 
 
@@ -341,18 +414,20 @@ def print_summary() -> None:
     Chips that cannot meet their Tj limit with the default cold plate geometry
     at any flow rate are marked as needing geometry redesign.
     """
+    buf = io.StringIO()
     inlet_c = 35.0
     flow_max = 100.0
 
-    print("=" * 72)
-    print("Summary: All Chips at Minimum Flow Rate for Tj < Tj_limit")
-    print(f"  Coolant: water | Inlet: {inlet_c}°C | Default cold plate geometry")
-    print("-" * 72)
-    print(
+    _emit(
+        buf,
+        "=" * 72,
+        "Summary: All Chips at Minimum Flow Rate for Tj < Tj_limit",
+        f"  Coolant: water | Inlet: {inlet_c}°C | Default cold plate geometry",
+        "-" * 72,
         f"  {'Chip':<22}  {'TDP (W)':>8}  {'Tj Lim':>7}  "
-        f"{'Min Flow':>9}  {'Tj (°C)':>8}  {'ΔP (kPa)':>9}"
+        f"{'Min Flow':>9}  {'Tj (°C)':>8}  {'ΔP (kPa)':>9}",
+        "-" * 72,
     )
-    print("-" * 72)
 
     for chip in ALL_CHIPS:
         opt_input = OptimizeFlowRateInput(
@@ -366,35 +441,49 @@ def print_summary() -> None:
         min_flow, result = optimize_flow(opt_input)
 
         if result is not None:
-            print(
+            _emit(
+                buf,
                 f"  {chip.name:<22}  {chip.tdp_w:>8.0f}  {chip.tj_limit_c:>6.0f}°  "
                 f"{min_flow:>8.1f}  {result.junction_temp_c:>8.1f}  "
                 f"{result.pressure_drop_pa / 1000:>9.1f}"
             )
         else:
-            print(
+            _emit(
+                buf,
                 f"  {chip.name:<22}  {chip.tdp_w:>8.0f}  {chip.tj_limit_c:>6.0f}°  "
                 f"{'redesign':>9}  {'N/A':>8}  {'N/A':>9}"
             )
 
-    print("-" * 72)
-    print("  'redesign' = default cold plate geometry cannot meet target at any flow rate.")
-    print("  These chips require larger contact area, more channels, or lower R_jc.")
-    print()
+    _emit(
+        buf,
+        "-" * 72,
+        "  'redesign' = default cold plate geometry cannot meet target at any flow rate.",
+        "  These chips require larger contact area, more channels, or lower R_jc.",
+        "",
+    )
+    sys.stdout.write(buf.getvalue())
 
 
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
 
+BENCHMARKS = (
+    benchmark_h100_flow_sweep,
+    benchmark_b200_coolant_comparison,
+    benchmark_mi300x_inlet_sweep,
+    benchmark_gaudi3_flow_optimization,
+)
+
+
 if __name__ == "__main__":
     print()
     print("Datacenter GPU Cold Plate Thermal Benchmarks")
     print("Using thermal-mcp-server physics engine")
     print()
 
-    benchmark_h100_flow_sweep()
-    benchmark_b200_coolant_comparison()
-    benchmark_mi300x_inlet_sweep()
-    benchmark_gaudi3_flow_optimization()
+    # Run in-process and in order: the whole suite takes a few milliseconds, far less
+    # than the cost of starting worker processes.
+    for benchmark in BENCHMARKS:
+        benchmark()
     print_summary()
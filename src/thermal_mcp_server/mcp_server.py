@@ -1,4 +1,4 @@
-"""MCP server exposing three thermal analysis tools."""
+"""MCP server exposing four thermal analysis tools."""
 
 from __future__ import annotations
 
@@ -7,8 +7,14 @@ from typing import Any
 from fastmcp import FastMCP
 from pydantic import ValidationError
 
-from .physics import COOLANTS, analyze, optimize_flow
-from .schemas import AnalyzeColdplateInput, CompareCoolantsInput, Geometry, OptimizeFlowRateInput
+from .physics import analyze, analyze_batch, analyze_coolants, optimize_flow
+from .schemas import (
+    AnalyzeBatchInput,
+    AnalyzeColdplateInput,
+    CompareCoolantsInput,
+    Geometry,
+    OptimizeFlowRateInput,
+)
 
 mcp = FastMCP("thermal-mcp-server")
 
@@ -43,6 +49,36 @@ def analyze_coldplate_impl(
     return analyze(payload).model_dump()
 
 
+def analyze_sweep_impl(
+    heat_load_w: float,
+    flow_rates_lpm: list[float] | None = None,
+    inlet_temps_c: list[float] | None = None,
+    flow_rate_lpm: float = 8.0,
+    inlet_temp_c: float = 25.0,
+    ambient_temp_c: float = 25.0,
+    coolant: str = "water",
+    r_jc_k_per_w: float = 0.04,
+    r_tim_k_per_w: float = 0.02,
+    geometry: dict[str, Any] | None = None,
+) -> dict:
+    try:
+        payload = AnalyzeBatchInput(
+            heat_load_w=heat_load_w,
+            flow_rates_lpm=flow_rates_lpm,
+            inlet_temps_c=inlet_temps_c,
+            flow_rate_lpm=flow_rate_lpm,
+            inlet_temp_c=inlet_temp_c,
+            ambient_temp_c=ambient_temp_c,
+            coolant=coolant,
+            r_jc_k_per_w=r_jc_k_per_w,
+            r_tim_k_per_w=r_tim_k_per_w,
+            geometry=_geometry_from_dict(geometry),
+        )
+    except ValidationError as exc:
+        return {"error": exc.errors()}
+    return {"inputs": payload.model_dump(), "results": [result.model_dump() for result in analyze_batch(payload)]}
+
+
 def compare_coolants_impl(
     heat_load_w: float,
     flow_rate_lpm: float,
@@ -65,12 +101,7 @@ def compare_coolants_impl(
     except ValidationError as exc:
         return {"error": exc.errors()}
 
-    base = payload.model_dump()
-    comparisons: dict[str, dict] = {}
-    for coolant in COOLANTS:
-        point = AnalyzeColdplateInput(coolant=coolant, **base)
-        comparisons[coolant] = analyze(point).model_dump()
-
+    comparisons = {name: result.model_dump() for name, result in analyze_coolants(payload).items()}
     return {"inputs": payload.model_dump(), "results": comparisons}
 
 
@@ -135,6 +166,31 @@ def analyze_coldplate(
     )
 
 
+@mcp.tool(name="analyze_sweep")
+def analyze_sweep(
+    heat_load_w: float,
+    flow_rates_lpm: list[float] | None = None,
+    inlet_temps_c: list[float] | None = None,
+    flow_rate_lpm: float = 8.0,
+    inlet_temp_c: float = 25.0,
+    ambient_temp_c: float = 25.0,
+    coolant: str = "water",
+    r_jc_k_per_w: float = 0.04,
+    r_tim_k_per_w: float = 0.02,
+    geometry: dict[str, Any] | None = None,
+):
+    """Run analyze_coldplate across a sweep of flow rates and/or inlet temperatures in one call.
+
+    Swept values replace flow_rate_lpm / inlet_temp_c point by point; when both sweeps
+    are given they are paired element-wise and must have equal length. Returns one full
+    analysis per point, in sweep order — use it for Tj-vs-flow curves and pump sizing.
+    """
+    return analyze_sweep_impl(
+        heat_load_w, flow_rates_lpm, inlet_temps_c, flow_rate_lpm, inlet_temp_c,
+        ambient_temp_c, coolant, r_jc_k_per_w, r_tim_k_per_w, geometry,
+    )
+
+
 @mcp.tool(name="compare_coolants")
 def compare_coolants(
     heat_load_w: float,
@@ -171,7 +227,7 @@ def optimize_flow_rate(
 ):
     """Find the minimum coolant flow rate that keeps junction temperature at or below a target.
 
-    Uses binary search between flow_min_lpm and flow_max_lpm.
+    Uses a bracketed Newton search between flow_min_lpm and flow_max_lpm.
     Returns the minimum flow rate, whether the target was met,
     and the full thermal analysis at that operating point.
     """
@@ -7,12 +7,22 @@ are documented inline. See docs/physics.md for full derivation and scope.
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import NamedTuple
 
-from .schemas import AnalyzeColdplateInput, AnalyzeColdplateOutput, OptimizeFlowRateInput
+from .schemas import (
+    AnalyzeBatchInput,
+    AnalyzeColdplateInput,
+    AnalyzeColdplateOutput,
+    CompareCoolantsInput,
+    Geometry,
+    OptimizeFlowRateInput,
+)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CoolantProperties:
     density_kg_m3: float
     cp_j_kgk: float
@@ -28,27 +38,73 @@ COOLANTS: dict[str, CoolantProperties] = {
 }
 
 
-def _flow_quantities(inp: AnalyzeColdplateInput) -> tuple[float, float, float, float]:
-    geom = inp.geometry
-    props = COOLANTS[inp.coolant]
-    flow_m3s = inp.flow_rate_lpm / 1000.0 / 60.0
+@dataclass(frozen=True, slots=True)
+class _PlateTerms:
+    """Flow-independent quantities shared by every operating point of one cold plate."""
+
+    props: CoolantProperties
+    # Prandtl number raised to the Dittus-Boelter heating exponent, Pr^0.4.
+    pr_04: float
+    area_total: float
+    wetted_area: float
+    r_base: float
+    # Reynolds number per m/s of channel velocity: rho * Dh / mu.
+    re_per_velocity: float
+    # Convection coefficient per unit Nusselt number: k / Dh.
+    h_per_nu: float
+    # Darcy-Weisbach pressure drop per unit f * v^2: (L / Dh) * rho / 2.
+    dp_per_f_v2: float
+
+
+# Geometry is frozen and hashable; clients typically sweep flow or heat load on one plate.
+@lru_cache(maxsize=128)
+def _plate_terms(coolant: str, geom: Geometry) -> _PlateTerms:
+    props = COOLANTS[coolant]
     # ASSUMPTION: square channel cross-section (side = channel_width). For rectangular channels, replace with width × height.
     area_total = geom.channel_count * geom.channel_width_m * geom.hydraulic_diameter_m
-    velocity = flow_m3s / area_total
-    re = props.density_kg_m3 * velocity * geom.hydraulic_diameter_m / props.mu_pa_s
+    # Square channel: wetted perimeter = 4 * side = 4 * Dh (since Dh = side for a square channel).
+    # Consistent with cross-section assumption above (area = channel_width * Dh = side^2).
+    wetted_area = geom.channel_count * 4 * geom.channel_width_m * geom.channel_length_m
+    r_base = geom.base_thickness_m / (geom.copper_k_w_mk * geom.contact_area_m2)
     pr = props.cp_j_kgk * props.mu_pa_s / props.k_w_mk
-    return flow_m3s, velocity, re, pr
+    dh = geom.hydraulic_diameter_m
+    return _PlateTerms(
+        props,
+        pr**0.4,
+        area_total,
+        wetted_area,
+        r_base,
+        props.density_kg_m3 * dh / props.mu_pa_s,
+        props.k_w_mk / dh,
+        geom.channel_length_m / dh * props.density_kg_m3 / 2,
+    )
+
 
+# Correlation values at the edges of the Re 2300-4000 transition band.
+_NU_LAM = 4.36
+_NU_TURB_EDGE_PER_PR_04 = 0.023 * 4000**0.8
+_F_LAM_EDGE = 64.0 / 2300.0
+_F_TURB_EDGE = 0.3164 * 4000 ** (-0.25)
 
-def _nusselt(re: float, pr: float) -> tuple[float, str]:
+
+def _nusselt(re: float, pr_04: float) -> tuple[float, str]:
     if re < 2300:
-        return 4.36, "laminar"
+        return _NU_LAM, "laminar"
     if re > 4000:
-        return 0.023 * re**0.8 * pr**0.4, "turbulent"
-    nu_lam = 4.36
-    nu_turb = 0.023 * 4000**0.8 * pr**0.4
+        return 0.023 * re**0.8 * pr_04, "turbulent"
+    nu_turb = _NU_TURB_EDGE_PER_PR_04 * pr_04
     blend = (re - 2300) / (4000 - 2300)
-    return nu_lam * (1 - blend) + nu_turb * blend, "transitional"
+    return _NU_LAM * (1 - blend) + nu_turb * blend, "transitional"
+
+
+def _nusselt_log_slope(re: float, pr_04: float, nu: float) -> float:
+    """d(ln Nu)/d(ln Re) for the piecewise correlation in _nusselt."""
+    if re < 2300:
+        return 0.0
+    if re > 4000:
+        return 0.8
+    nu_turb = _NU_TURB_EDGE_PER_PR_04 * pr_04
+    return (nu_turb - _NU_LAM) / (4000 - 2300) * re / nu
 
 
 def _friction_factor(re: float) -> float:
@@ -57,90 +113,270 @@ def _friction_factor(re: float) -> float:
     if re > 4000:
         return 0.3164 * re ** (-0.25)
     # Transition regime: linear blend matching Nusselt treatment (Re 2300–4000)
-    f_lam = 64.0 / 2300.0
-    f_turb = 0.3164 * 4000 ** (-0.25)
     blend = (re - 2300) / (4000 - 2300)
-    return f_lam * (1 - blend) + f_turb * blend
+    return _F_LAM_EDGE * (1 - blend) + _F_TURB_EDGE * blend
 
 
-def analyze(inp: AnalyzeColdplateInput) -> AnalyzeColdplateOutput:
-    props = COOLANTS[inp.coolant]
-    geom = inp.geometry
-    flow_m3s, velocity, re, pr = _flow_quantities(inp)
+class _OperatingPoint(NamedTuple):
+    reynolds: float
+    nusselt: float
+    regime: str
+    h: float
+    r_conv: float
+    r_total: float
+    coolant_rise: float
+    # Junction temperature above the coolant inlet; Tj = inlet + junction_rise.
+    junction_rise: float
+    dp: float
+    pump_power: float
 
-    nu, regime = _nusselt(re, pr)
-    h = nu * props.k_w_mk / geom.hydraulic_diameter_m
 
-    # Square channel: wetted perimeter = 4 * side = 4 * Dh (since Dh = side for a square channel).
-    # Consistent with cross-section assumption above (area = channel_width * Dh = side^2).
-    wetted_area = geom.channel_count * 4 * geom.channel_width_m * geom.channel_length_m
-    r_conv = 1.0 / (h * wetted_area)
-    r_base = geom.base_thickness_m / (geom.copper_k_w_mk * geom.contact_area_m2)
-    r_total = inp.r_jc_k_per_w + inp.r_tim_k_per_w + r_base + r_conv
+# Pure function of hashable scalars, so memoised: optimize_flow, the benchmarks, and
+# repeated tool calls re-probe identical operating points. Inlet temperature only
+# offsets Tj (properties are fixed), so it is left out and inlet sweeps share one point.
+@lru_cache(maxsize=4096)
+def _solve_point(
+    terms: _PlateTerms,
+    heat_load_w: float,
+    r_jc_k_per_w: float,
+    r_tim_k_per_w: float,
+    flow_rate_lpm: float,
+) -> _OperatingPoint:
+    props = terms.props
+    flow_m3s = flow_rate_lpm / 1000.0 / 60.0
+    velocity = flow_m3s / terms.area_total
+    re = terms.re_per_velocity * velocity
+
+    nu, regime = _nusselt(re, terms.pr_04)
+    h = nu * terms.h_per_nu
+
+    r_conv = 1.0 / (h * terms.wetted_area)
+    r_total = r_jc_k_per_w + r_tim_k_per_w + terms.r_base + r_conv
 
     m_dot = flow_m3s * props.density_kg_m3
-    coolant_rise = inp.heat_load_w / (m_dot * props.cp_j_kgk)
-    t_bulk = inp.inlet_temp_c + 0.5 * coolant_rise
-    t_j = t_bulk + inp.heat_load_w * r_total
+    coolant_rise = heat_load_w / (m_dot * props.cp_j_kgk)
+    # Bulk coolant sits at inlet + half the rise; the junction a further Q * R_total above.
+    junction_rise = 0.5 * coolant_rise + heat_load_w * r_total
 
     f = _friction_factor(re)
-    dp = f * (geom.channel_length_m / geom.hydraulic_diameter_m) * (props.density_kg_m3 * velocity**2 / 2)
+    dp = f * terms.dp_per_f_v2 * velocity * velocity
     # ASSUMPTION: 50% pump efficiency (typical centrifugal pump at partial load). Adjust for specific pump curve.
     pump_power = dp * flow_m3s / 0.5
 
+    return _OperatingPoint(re, nu, regime, h, r_conv, r_total, coolant_rise, junction_rise, dp, pump_power)
+
+
+_WARN_HOT = "junction temperature exceeds 85C"
+_WARN_LOW_RE = "very low Reynolds number; risk of poor flow distribution"
+
+
+def _analyze_point(
+    inp: AnalyzeColdplateInput,
+    terms: _PlateTerms,
+    flow_rate_lpm: float,
+    inlet_temp_c: float,
+) -> AnalyzeColdplateOutput:
+    pt = _solve_point(terms, inp.heat_load_w, inp.r_jc_k_per_w, inp.r_tim_k_per_w, flow_rate_lpm)
+    t_j = inlet_temp_c + pt.junction_rise
+
     warnings: list[str] = []
     # H100 SXM throttle onset is 83°C per NVIDIA thermal guidelines; 85°C used as conservative design ceiling
     if t_j > 85:
-        warnings.append("junction temperature exceeds 85C")
-    if re < 500:
-        warnings.append("very low Reynolds number; risk of poor flow distribution")
+        warnings.append(_WARN_HOT)
+    if pt.reynolds < 500:
+        warnings.append(_WARN_LOW_RE)
 
     return AnalyzeColdplateOutput(
         coolant=inp.coolant,
-        regime=regime,
-        reynolds=re,
-        nusselt=nu,
-        heat_transfer_coeff_w_m2k=h,
-        pressure_drop_pa=dp,
-        pump_power_w=pump_power,
-        coolant_rise_c=coolant_rise,
+        regime=pt.regime,
+        reynolds=pt.reynolds,
+        nusselt=pt.nusselt,
+        heat_transfer_coeff_w_m2k=pt.h,
+        pressure_drop_pa=pt.dp,
+        pump_power_w=pt.pump_power,
+        coolant_rise_c=pt.coolant_rise,
         junction_temp_c=t_j,
         resistances_k_per_w={
             "junction_to_case": inp.r_jc_k_per_w,
             "tim": inp.r_tim_k_per_w,
-            "base_conduction": r_base,
-            "convection": r_conv,
-            "total": r_total,
+            "base_conduction": terms.r_base,
+            "convection": pt.r_conv,
+            "total": pt.r_total,
         },
         warnings=warnings,
     )
 
 
-def optimize_flow(inp: OptimizeFlowRateInput, max_iter: int = 40) -> tuple[float, AnalyzeColdplateOutput | None]:
-    """Binary search for minimum flow rate meeting the junction temperature target.
+def analyze(inp: AnalyzeColdplateInput) -> AnalyzeColdplateOutput:
+    return _analyze_point(inp, _plate_terms(inp.coolant, inp.geometry), inp.flow_rate_lpm, inp.inlet_temp_c)
+
 
-    Returns (minimum_flow_lpm, analysis_at_minimum_flow). If no flow rate in
-    [flow_min_lpm, flow_max_lpm] meets the target, returns (flow_max_lpm, None).
+def analyze_batch(inp: AnalyzeBatchInput) -> list[AnalyzeColdplateOutput]:
+    """Evaluate one cold plate at every point of a flow-rate and/or inlet-temperature sweep.
+
+    Inputs are validated once and the flow-independent terms (coolant properties,
+    Prandtl number, channel areas, base resistance) are computed once for the
+    whole sweep. Returns one result per point, in sweep order.
+    """
+    terms = _plate_terms(inp.coolant, inp.geometry)
+    flows, inlets = inp.flow_rates_lpm, inp.inlet_temps_c
+    n = len(flows if flows is not None else inlets)
+    if flows is None:
+        flows = [inp.flow_rate_lpm] * n
+    if inlets is None:
+        inlets = [inp.inlet_temp_c] * n
+    return [_analyze_point(inp, terms, q, t) for q, t in zip(flows, inlets)]
+
+
+def analyze_coolants(inp: CompareCoolantsInput) -> dict[str, AnalyzeColdplateOutput]:
+    """Analyze one operating point with every coolant in COOLANTS, keyed by coolant name."""
+    base = inp.model_dump()
+    return {name: analyze(AnalyzeColdplateInput(coolant=name, **base)) for name in COOLANTS}
+
+
+def optimize_flow(
+    inp: OptimizeFlowRateInput,
+    max_iter: int = 40,
+    tol_lpm: float = 1e-3,
+) -> tuple[float, AnalyzeColdplateOutput | None]:
+    """Search for the minimum flow rate meeting the junction temperature target.
+
+    Returns (minimum_flow_lpm, analysis_at_minimum_flow), with the flow within
+    ``tol_lpm`` above the true minimum (or as close as ``max_iter`` probes get). If
+    flow_min_lpm already meets the target it is returned; if no flow rate in
+    [flow_min_lpm, flow_max_lpm] meets it, returns (flow_max_lpm, None).
+    Solutions are cached per input.
     """
+    key = tuple((name, getattr(inp, name)) for name in OptimizeFlowRateInput.model_fields)
+    flow, result = _optimize_flow_cached(key, max_iter, tol_lpm)
+    return flow, result.model_copy(deep=True) if result is not None else None
+
+
+def _flow_seed(terms: _PlateTerms, heat_load_w: float, budget: float) -> float:
+    """Closed-form flow whose excess over the Tj floor equals ``budget``.
+
+    excess(Q) = a/Q + c/Nu(Q), and Nu is piecewise in Re ∝ Q: constant (laminar),
+    linear (transition blend) or ∝ Q^0.8 (turbulent). Each piece is solved in turn
+    and the first solution that lands inside its own regime is returned.
+    """
+    props = terms.props
+    a = 0.5 * heat_load_w * 60000.0 / (props.density_kg_m3 * props.cp_j_kgk)
+    c = heat_load_w / (terms.h_per_nu * terms.wetted_area)
+    re_per_lpm = terms.re_per_velocity / (60000.0 * terms.area_total)
+
+    # Laminar: a/Q + c/Nu_lam = budget.
+    if c / _NU_LAM < budget:
+        q = a / (budget - c / _NU_LAM)
+        if q * re_per_lpm < 2300:
+            return q
+
+    # Transition: Nu = alpha + beta*Q, so a/Q + c/(alpha + beta*Q) = budget is a quadratic.
+    slope = (_NU_TURB_EDGE_PER_PR_04 * terms.pr_04 - _NU_LAM) / (4000 - 2300)
+    alpha = _NU_LAM - slope * 2300
+    beta = slope * re_per_lpm
+    qa = budget * beta
+    qb = budget * alpha - a * beta - c
+    qc = -a * alpha
+    disc = qb * qb - 4 * qa * qc
+    if disc >= 0:
+        for q in ((-qb + math.sqrt(disc)) / (2 * qa), (-qb - math.sqrt(disc)) / (2 * qa)):
+            if 2300 <= q * re_per_lpm <= 4000:
+                return q
+
+    # Turbulent: a/Q + b*Q^-0.8 = budget. The left side is convex and decreasing, so
+    # Newton from the coolant-rise bound a/budget (still above budget) climbs to the root.
+    b = c / (0.023 * re_per_lpm**0.8 * terms.pr_04)
+    q = a / budget
+    for _ in range(20):
+        step = (a / q + b * q**-0.8 - budget) / (a / q + 0.8 * b * q**-0.8) * q
+        q += step
+        if step < 1e-12 * q:
+            break
+    return q
+
+
+def _rise_limits(inp: OptimizeFlowRateInput, terms: _PlateTerms) -> tuple[float, float]:
+    """Allowed junction rise above the inlet, and its flow-independent part.
+
+    Returns (max_rise, fixed_rise), where fixed_rise = Q_heat * (R_jc + R_tim + R_base).
+    """
+    max_rise = inp.max_junction_temp_c - inp.inlet_temp_c
+    fixed_rise = inp.heat_load_w * (inp.r_jc_k_per_w + inp.r_tim_k_per_w + terms.r_base)
+    return max_rise, fixed_rise
+
+
+# Keyed on the validated field values, since pydantic models are not hashable (Geometry
+# is frozen, so it is). A JSON round trip would not do: pydantic writes inf as null.
+@lru_cache(maxsize=256)
+def _optimize_flow_cached(
+    fields: tuple[tuple[str, object], ...],
+    max_iter: int,
+    tol_lpm: float,
+) -> tuple[float, AnalyzeColdplateOutput | None]:
+    inp = OptimizeFlowRateInput.model_construct(**dict(fields))
+    # Validated once; every probe reuses it and the plate terms, varying only the flow rate.
+    point = AnalyzeColdplateInput(
+        heat_load_w=inp.heat_load_w,
+        flow_rate_lpm=inp.flow_max_lpm,
+        inlet_temp_c=inp.inlet_temp_c,
+        ambient_temp_c=inp.ambient_temp_c,
+        coolant=inp.coolant,
+        r_jc_k_per_w=inp.r_jc_k_per_w,
+        r_tim_k_per_w=inp.r_tim_k_per_w,
+        geometry=inp.geometry,
+    )
+    terms = _plate_terms(inp.coolant, inp.geometry)
+
+    # Probes only need the operating point; the full output (warnings, resistance
+    # breakdown) is built once, for the flow that is returned.
+    def probe(flow_lpm: float) -> _OperatingPoint:
+        return _solve_point(terms, inp.heat_load_w, inp.r_jc_k_per_w, inp.r_tim_k_per_w, flow_lpm)
+
+    def at(flow_lpm: float) -> AnalyzeColdplateOutput:
+        return _analyze_point(point, terms, flow_lpm, inp.inlet_temp_c)
+
     lo, hi = inp.flow_min_lpm, inp.flow_max_lpm
-    best: AnalyzeColdplateOutput | None = None
+    max_rise, fixed_rise = _rise_limits(inp, terms)
+    # Tj falls monotonically with flow towards inlet + fixed_rise, so check the bounds
+    # first: no flow beats that floor, and the range ends may already decide the answer.
+    if fixed_rise >= max_rise:
+        return hi, None
+    if probe(hi).junction_rise > max_rise:
+        return hi, None
+    if probe(lo).junction_rise <= max_rise:
+        return lo, at(lo)
+
+    # junction_rise = fixed_rise + excess(Q), where excess = 0.5 * coolant_rise + Q_heat * R_conv
+    # falls roughly as a power of Q, so Newton runs on ln(excess) vs ln(Q).
+    budget = max_rise - fixed_rise
+    log_budget = math.log(budget)
+    # Start at the closed-form root, so the search normally only confirms it from both sides.
+    q = _flow_seed(terms, inp.heat_load_w, budget)
+    if not lo < q < hi:
+        q = math.sqrt(lo * hi)
+
+    # Each probe tightens the [infeasible lo, feasible hi] bracket; a step that leaves
+    # it falls back to geometric bisection.
     for _ in range(max_iter):
-        mid = 0.5 * (lo + hi)
-        result = analyze(
-            AnalyzeColdplateInput(
-                heat_load_w=inp.heat_load_w,
-                flow_rate_lpm=mid,
-                inlet_temp_c=inp.inlet_temp_c,
-                ambient_temp_c=inp.ambient_temp_c,
-                coolant=inp.coolant,
-                r_jc_k_per_w=inp.r_jc_k_per_w,
-                r_tim_k_per_w=inp.r_tim_k_per_w,
-                geometry=inp.geometry,
-            )
-        )
-        if result.junction_temp_c <= inp.max_junction_temp_c:
-            hi = mid
-            best = result
+        pt = probe(q)
+        if pt.junction_rise <= max_rise:
+            hi = q
         else:
-            lo = mid
-    return hi, best
+            lo = q
+        if hi - lo < tol_lpm:
+            break
+        excess = pt.junction_rise - fixed_rise
+        # d ln(excess) / d ln(Q); R_conv ∝ 1/Nu and Re ∝ Q.
+        elasticity = -(
+            0.5 * pt.coolant_rise
+            + inp.heat_load_w * pt.r_conv * _nusselt_log_slope(pt.reynolds, terms.pr_04, pt.nusselt)
+        ) / excess
+        step = q * (1.0 - math.exp(-(math.log(excess) - log_budget) / elasticity))
+        if abs(step) < 0.5 * tol_lpm:
+            # At the root already; step just past it, away from this probe's side,
+            # so the bracket closes.
+            step = 0.5 * tol_lpm if pt.junction_rise <= max_rise else -0.5 * tol_lpm
+        q = q - step
+        if not lo < q < hi:
+            q = math.sqrt(lo * hi)
+    return hi, at(hi)
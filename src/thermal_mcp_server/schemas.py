@@ -2,16 +2,23 @@
 
 from __future__ import annotations
 
-from typing import Literal
+from typing import Annotated, Literal
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
 CoolantName = Literal["water", "glycol50"]
+FlowRateLpm = Annotated[float, Field(gt=0)]
+InletTempC = Annotated[float, Field(ge=-20.0, le=80.0)]
 
 
 class Geometry(BaseModel):
-    """Cold plate geometry and material parameters."""
+    """Cold plate geometry and material parameters.
+
+    Frozen, so instances are hashable and can key caches of geometry-derived terms.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     channel_count: int = Field(default=40, ge=1)
     hydraulic_diameter_m: float = Field(default=1.0e-3, gt=0)
@@ -41,6 +48,34 @@ class AnalyzeColdplateInput(BaseModel):
         return self
 
 
+class AnalyzeBatchInput(AnalyzeColdplateInput):
+    """Inputs for evaluating one cold plate across a flow-rate and/or inlet-temperature sweep.
+
+    Swept values replace ``flow_rate_lpm`` / ``inlet_temp_c`` point by point. When
+    both sweeps are given they are paired element-wise and must have equal length.
+    """
+
+    flow_rates_lpm: list[FlowRateLpm] | None = Field(default=None, min_length=1)
+    inlet_temps_c: list[InletTempC] | None = Field(default=None, min_length=1)
+
+    @model_validator(mode="after")
+    def ambient_not_hotter_than_inlet(self) -> "AnalyzeBatchInput":
+        # Overrides the single-point check: when inlets are swept, inlet_temp_c is unused.
+        inlets = self.inlet_temps_c if self.inlet_temps_c is not None else [self.inlet_temp_c]
+        if self.ambient_temp_c > min(inlets) + 20:
+            raise ValueError("ambient_temp_c is unrealistically high relative to inlet temperature")
+        return self
+
+    @model_validator(mode="after")
+    def sweep_valid(self) -> "AnalyzeBatchInput":
+        flows, inlets = self.flow_rates_lpm, self.inlet_temps_c
+        if flows is None and inlets is None:
+            raise ValueError("provide flow_rates_lpm and/or inlet_temps_c")
+        if flows is not None and inlets is not None and len(flows) != len(inlets):
+            raise ValueError("flow_rates_lpm and inlet_temps_c must have the same length")
+        return self
+
+
 class AnalyzeColdplateOutput(BaseModel):
     """Stable output schema for tool consumers."""
 
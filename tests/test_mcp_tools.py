@@ -8,6 +8,24 @@ def test_analyze_tool_shape():
     assert "resistances_k_per_w" in out
 
 
+def test_sweep_tool_shape():
+    out = mcp_server.analyze_sweep_impl(heat_load_w=700, flow_rates_lpm=[4, 8, 12])
+    tjs = [r["junction_temp_c"] for r in out["results"]]
+    assert len(tjs) == 3
+    assert tjs[0] > tjs[1] > tjs[2]
+
+
+def test_sweep_tool_requires_a_sweep():
+    out = mcp_server.analyze_sweep_impl(heat_load_w=700)
+    [error] = out["error"]
+    assert "provide flow_rates_lpm and/or inlet_temps_c" in error["msg"]
+
+
+def test_sweep_tool_accepts_warm_inlet_sweep():
+    out = mcp_server.analyze_sweep_impl(heat_load_w=700, inlet_temps_c=[60, 70], ambient_temp_c=50)
+    assert len(out["results"]) == 2
+
+
 def test_compare_tool_shape():
     out = mcp_server.compare_coolants_impl(heat_load_w=700, flow_rate_lpm=8)
     assert set(out["results"].keys()) == {"water", "glycol50"}
@@ -1,33 +1,35 @@
 import pytest
 
-from thermal_mcp_server.physics import analyze
-from thermal_mcp_server.schemas import AnalyzeColdplateInput
+from thermal_mcp_server import physics
+from thermal_mcp_server.physics import analyze, analyze_batch, analyze_coolants, optimize_flow
+from thermal_mcp_server.schemas import (
+    AnalyzeBatchInput,
+    AnalyzeColdplateInput,
+    CompareCoolantsInput,
+    OptimizeFlowRateInput,
+)
 
 
 def test_tj_monotonic_with_flow():
-    low = analyze(AnalyzeColdplateInput(heat_load_w=700, flow_rate_lpm=4, coolant="water"))
-    high = analyze(AnalyzeColdplateInput(heat_load_w=700, flow_rate_lpm=14, coolant="water"))
+    low, high = analyze_batch(AnalyzeBatchInput(heat_load_w=700, flow_rates_lpm=[4, 14], coolant="water"))
     assert high.junction_temp_c <= low.junction_temp_c
 
 
 def test_regime_switch_sensible():
-    lam = analyze(AnalyzeColdplateInput(heat_load_w=700, flow_rate_lpm=0.8, coolant="water"))
-    turb = analyze(AnalyzeColdplateInput(heat_load_w=700, flow_rate_lpm=12, coolant="water"))
+    lam, turb = analyze_batch(AnalyzeBatchInput(heat_load_w=700, flow_rates_lpm=[0.8, 12], coolant="water"))
     assert lam.regime in {"laminar", "transitional"}
     assert turb.regime in {"transitional", "turbulent"}
     assert turb.heat_transfer_coeff_w_m2k > lam.heat_transfer_coeff_w_m2k
 
 
 def test_glycol_generally_worse_than_water():
-    w = analyze(AnalyzeColdplateInput(heat_load_w=700, flow_rate_lpm=8, coolant="water"))
-    g = analyze(AnalyzeColdplateInput(heat_load_w=700, flow_rate_lpm=8, coolant="glycol50"))
+    results = analyze_coolants(CompareCoolantsInput(heat_load_w=700, flow_rate_lpm=8))
+    w, g = results["water"], results["glycol50"]
     assert g.junction_temp_c >= w.junction_temp_c or g.pump_power_w >= w.pump_power_w
 
 
 def test_pressure_drop_superlinear_vs_flow():
-    a = analyze(AnalyzeColdplateInput(heat_load_w=700, flow_rate_lpm=4, coolant="water"))
-    b = analyze(AnalyzeColdplateInput(heat_load_w=700, flow_rate_lpm=8, coolant="water"))
-    c = analyze(AnalyzeColdplateInput(heat_load_w=700, flow_rate_lpm=12, coolant="water"))
+    a, b, c = analyze_batch(AnalyzeBatchInput(heat_load_w=700, flow_rates_lpm=[4, 8, 12], coolant="water"))
     assert a.pressure_drop_pa < b.pressure_drop_pa < c.pressure_drop_pa
     ratio1 = b.pressure_drop_pa / a.pressure_drop_pa
     ratio2 = c.pressure_drop_pa / b.pressure_drop_pa
@@ -35,13 +37,115 @@ def test_pressure_drop_superlinear_vs_flow():
     assert ratio2 > 1.1
 
 
-def test_invalid_inputs_rejected():
-    with pytest.raises(Exception):
-        AnalyzeColdplateInput(heat_load_w=-1, flow_rate_lpm=8)
+def test_batch_matches_pointwise_analysis():
+    flows = [2.0, 8.0, 14.0]
+    inlets = [20.0, 30.0, 40.0]
+    batch = analyze_batch(AnalyzeBatchInput(heat_load_w=700, flow_rates_lpm=flows, inlet_temps_c=inlets))
+    for flow, inlet, result in zip(flows, inlets, batch):
+        single = analyze(AnalyzeColdplateInput(heat_load_w=700, flow_rate_lpm=flow, inlet_temp_c=inlet))
+        assert result == single
+
+
+@pytest.mark.parametrize("kwargs", [
+    {},
+    {"flow_rates_lpm": [8, -1]},
+    {"flow_rates_lpm": [8, 10], "inlet_temps_c": [25]},
+    {"flow_rates_lpm": [], "inlet_temps_c": [20, 30]},
+    {"inlet_temps_c": [20, 60], "ambient_temp_c": 50},
+])
+def test_batch_sweep_validated(kwargs):
     with pytest.raises(Exception):
-        AnalyzeColdplateInput(heat_load_w=700, flow_rate_lpm=-1)
+        AnalyzeBatchInput(heat_load_w=700, **kwargs)
+
+
+def test_batch_ambient_checked_against_swept_inlets():
+    # The scalar inlet_temp_c default (25) is unused when inlets are swept.
+    batch = AnalyzeBatchInput(heat_load_w=700, inlet_temps_c=[60, 70], ambient_temp_c=50)
+    assert [r.junction_temp_c for r in analyze_batch(batch)] == [
+        analyze(AnalyzeColdplateInput(heat_load_w=700, inlet_temp_c=t, ambient_temp_c=50)).junction_temp_c
+        for t in (60, 70)
+    ]
+
+
+def test_optimize_flow_endpoints_and_interior():
+    infeasible = OptimizeFlowRateInput(heat_load_w=1200, max_junction_temp_c=85, inlet_temp_c=30)
+    assert optimize_flow(infeasible) == (infeasible.flow_max_lpm, None)
+
+    # Above the flow-independent floor, but flow_max_lpm is too low to reach the target.
+    starved = OptimizeFlowRateInput(heat_load_w=700, max_junction_temp_c=75, flow_max_lpm=2)
+    assert optimize_flow(starved) == (2, None)
+
+    easy = OptimizeFlowRateInput(heat_load_w=100, max_junction_temp_c=85, flow_min_lpm=2.0)
+    flow, result = optimize_flow(easy)
+    assert flow == 2.0 and result.junction_temp_c <= 85
+
+    interior = OptimizeFlowRateInput(heat_load_w=700, max_junction_temp_c=75)
+    flow, result = optimize_flow(interior)
+    assert result.junction_temp_c <= 75
+    below = analyze(AnalyzeColdplateInput(heat_load_w=700, flow_rate_lpm=flow - 0.01))
+    assert below.junction_temp_c > 75
+
+
+# (heat_load_w, max_junction_temp_c, regime at the minimum flow), default plate and water.
+REGIME_CASES = [
+    (100, 34.5, "laminar"),
+    (700, 75, "transitional"),
+    (700, 70, "turbulent"),
+]
+
+
+@pytest.mark.parametrize("heat_load_w, target, regime", REGIME_CASES)
+def test_optimize_flow_converges_in_each_regime(heat_load_w, target, regime):
+    flow, result = optimize_flow(OptimizeFlowRateInput(heat_load_w=heat_load_w, max_junction_temp_c=target))
+    assert result.regime == regime
+    assert result.junction_temp_c <= target
+    below = analyze(AnalyzeColdplateInput(heat_load_w=heat_load_w, flow_rate_lpm=flow - 1e-3))
+    assert below.junction_temp_c > target
+
+
+@pytest.mark.parametrize("heat_load_w, target, regime", REGIME_CASES)
+def test_flow_seed_solves_each_regime(heat_load_w, target, regime):
+    inp = OptimizeFlowRateInput(heat_load_w=heat_load_w, max_junction_temp_c=target)
+    terms = physics._plate_terms(inp.coolant, inp.geometry)
+    max_rise, fixed_rise = physics._rise_limits(inp, terms)
+    seed = physics._flow_seed(terms, heat_load_w, max_rise - fixed_rise)
+    result = analyze(AnalyzeColdplateInput(heat_load_w=heat_load_w, flow_rate_lpm=seed))
+    assert result.regime == regime
+    assert abs(result.junction_temp_c - target) < 1e-6
+
+
+@pytest.mark.parametrize("seed", [0.0, 3.0, 39.9])
+def test_optimize_flow_recovers_from_poor_seed(monkeypatch, seed):
+    # A seed outside the bracket, or far from the root, falls back to geometric bisection.
+    inp = OptimizeFlowRateInput(heat_load_w=700, max_junction_temp_c=70)
+    expected, _ = optimize_flow(inp)
+    monkeypatch.setattr(physics, "_flow_seed", lambda *args: seed)
+    physics._optimize_flow_cached.cache_clear()
+    try:
+        flow, result = optimize_flow(inp)
+    finally:
+        physics._optimize_flow_cached.cache_clear()
+    assert result.junction_temp_c <= 70
+    assert abs(flow - expected) < 1e-3
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"heat_load_w": float("inf")},
+    {"r_tim_k_per_w": float("inf")},
+])
+def test_optimize_flow_accepts_infinite_inputs(kwargs):
+    inp = OptimizeFlowRateInput(**kwargs)
+    assert optimize_flow(inp) == (inp.flow_max_lpm, None)
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"heat_load_w": -1, "flow_rate_lpm": 8},
+    {"heat_load_w": 700, "flow_rate_lpm": -1},
+    {"heat_load_w": 700, "flow_rate_lpm": 8, "inlet_temp_c": 500},
+])
+def test_invalid_inputs_rejected(kwargs):
     with pytest.raises(Exception):
-        AnalyzeColdplateInput(heat_load_w=700, flow_rate_lpm=8, inlet_temp_c=500)
+        AnalyzeColdplateInput(**kwargs)
 
 
 def test_hand_calc_validation_700w_water():